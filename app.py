@@ -6,9 +6,9 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager, UserMixin, login_user, logout_user, login_required, current_user
 from flask_socketio import SocketIO, join_room, leave_room, emit
 from werkzeug.security import generate_password_hash, check_password_hash
+from wire import new_message_payload, new_group_message_payload, message_sent_payload
 
 app = Flask(__name__)
-socketio = SocketIO(app)  # Initialize SocketIO
 
 # تنظیمات برای Fly.io
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-secret-key')
@@ -22,6 +22,12 @@ app.config['ALLOWED_AUDIO_EXTENSIONS'] = {'mp3', 'wav', 'ogg', 'm4a'}
 app.config['ALLOWED_DOCUMENT_EXTENSIONS'] = {'pdf', 'doc', 'docx', 'txt'}
 app.config['ADMIN_PASSWORD'] = os.environ.get('ADMIN_PASSWORD', 'admin123')
 
+# Opt-in compact Socket.IO protocol: MessagePack frames, epoch-ms timestamps,
+# sender names resolved client-side
+app.config['SOCKETIO_COMPACT'] = os.environ.get('SOCKETIO_COMPACT', '0') == '1'
+
+socketio = SocketIO(app, serializer='msgpack' if app.config['SOCKETIO_COMPACT'] else 'default')
+
 db = SQLAlchemy(app)
 login_manager = LoginManager(app)
 login_manager.login_view = 'login'
@@ -91,6 +97,10 @@ class Contact(db.Model):
     contact_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
     added_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+@app.context_processor
+def inject_wire_format():
+    return {'socketio_compact': app.config['SOCKETIO_COMPACT']}
+
 @login_manager.user_loader
 def load_user(user_id):
     return User.query.get(int(user_id))
@@ -207,10 +217,22 @@ def dashboard():
         GroupMember.status == 'approved'
     ).all()
     
+    # Member names per group, cached client-side to resolve senders
+    group_member_names = {group.group_id: {} for group in user_groups}
+    members = db.session.query(Group.group_id, User.id, User.name).join(
+        GroupMember, GroupMember.group_id == Group.id
+    ).join(User, User.id == GroupMember.user_id).filter(
+        Group.id.in_([group.id for group in user_groups]),
+        GroupMember.status == 'approved'
+    ).all()
+    for group_id, user_id, name in members:
+        group_member_names[group_id][user_id] = name
+    
     return render_template('dashboard.html', 
                          user=current_user, 
                          contacts=contacts, 
-                         groups=user_groups)
+                         groups=user_groups,
+                         group_member_names=group_member_names)
 
 @app.route('/chat/<int:user_id>')
 @login_required
@@ -539,20 +561,11 @@ def handle_private_message(data):
     db.session.commit()
     
     # Emit to receiver
-    emit('new_message', {
-        'id': new_message.id,
-        'sender_id': sender_id,
-        'sender_name': current_user.name,
-        'content': message_content,
-        'timestamp': new_message.timestamp.isoformat(),
-        'type': message_type
-    }, room=receiver_id)
+    compact = app.config['SOCKETIO_COMPACT']
+    emit('new_message', new_message_payload(new_message, current_user.name, compact), room=receiver_id)
     
     # Emit back to sender for confirmation
-    emit('message_sent', {
-        'id': new_message.id,
-        'timestamp': new_message.timestamp.isoformat()
-    })
+    emit('message_sent', message_sent_payload(new_message, compact))
 
 @socketio.on('group_message')
 def handle_group_message(data):
@@ -578,17 +591,11 @@ def handle_group_message(data):
         status='approved'
     ).all()
     
-    # Emit to all group members
+    # Emit to all group members (payload is the same for everyone, build it once)
+    payload = new_group_message_payload(new_message, group_id, current_user.name,
+                                        app.config['SOCKETIO_COMPACT'])
     for member in group_members:
-        emit('new_group_message', {
-            'id': new_message.id,
-            'group_id': group_id,
-            'sender_id': sender_id,
-            'sender_name': current_user.name,
-            'content': message_content,
-            'timestamp': new_message.timestamp.isoformat(),
-            'type': message_type
-        }, room=member.user_id)
+        emit('new_group_message', payload, room=member.user_id)
 
 @socketio.on('typing')
 def handle_typing(data):
@@ -0,0 +1,117 @@
+"""Bytes and CPU per delivered message: JSON vs compact (MessagePack) Socket.IO frames.
+
+    python bench_wire_format.py [deliveries]
+"""
+import json
+import sys
+import timeit
+from datetime import datetime
+from types import SimpleNamespace
+
+import msgpack
+
+from wire import epoch_ms, new_message_payload, new_group_message_payload, message_sent_payload
+
+EVENT_PACKET = 2
+
+
+def json_frame(event, payload):
+    # Same framing as the default python-socketio serializer
+    return (str(EVENT_PACKET) + json.dumps([event, payload], separators=(',', ':'))).encode('utf-8')
+
+
+def msgpack_frame(event, payload):
+    # Same framing as socket.io-msgpack-parser
+    return msgpack.packb({'type': EVENT_PACKET, 'data': [event, payload], 'nsp': '/'})
+
+
+def json_unframe(frame):
+    return json.loads(frame[1:].decode('utf-8'))
+
+
+def sample_message():
+    return SimpleNamespace(
+        id=48213,
+        sender_id=1207,
+        content='سلام، جلسه فردا ساعت ۱۰ برگزار می‌شود',
+        timestamp=datetime(2025, 3, 14, 9, 26, 53, 589793),
+        message_type='text'
+    )
+
+
+def check_payloads(message, sender_name):
+    # JSON mode must match the dicts app.py used to build inline
+    assert new_message_payload(message, sender_name) == {
+        'id': message.id,
+        'sender_id': message.sender_id,
+        'sender_name': sender_name,
+        'content': message.content,
+        'timestamp': message.timestamp.isoformat(),
+        'type': message.message_type
+    }
+    assert new_group_message_payload(message, 'mg_team_2025', sender_name) == {
+        'id': message.id,
+        'group_id': 'mg_team_2025',
+        'sender_id': message.sender_id,
+        'sender_name': sender_name,
+        'content': message.content,
+        'timestamp': message.timestamp.isoformat(),
+        'type': message.message_type
+    }
+    assert message_sent_payload(message) == {
+        'id': message.id,
+        'timestamp': message.timestamp.isoformat()
+    }
+
+    compact = new_message_payload(message, sender_name, compact=True)
+    assert set(compact) == {'id', 'sender_id', 'content', 'timestamp', 'type'}
+    assert type(compact['timestamp']) is int
+
+    compact_group = new_group_message_payload(message, 'mg_team_2025', sender_name, compact=True)
+    assert set(compact_group) == set(compact) | {'group_id'}
+    assert type(compact_group['timestamp']) is int
+    assert type(message_sent_payload(message, compact=True)['timestamp']) is int
+
+    # No float rounding: 2025-03-14 09:26:53.999999 UTC truncates to .999
+    assert epoch_ms(datetime(2025, 3, 14, 9, 26, 53, 999999)) == 1741944413999
+    assert epoch_ms(datetime(1970, 1, 1)) == 0
+
+
+def sample_events(message, sender_name):
+    return [
+        ('new_message', lambda compact: new_message_payload(message, sender_name, compact)),
+        ('new_group_message', lambda compact: new_group_message_payload(message, 'mg_team_2025', sender_name, compact)),
+    ]
+
+
+def measure(event, build, frame, unframe, compact, deliveries):
+    encoded = frame(event, build(compact))
+    encode = timeit.timeit(lambda: frame(event, build(compact)), number=deliveries)
+    decode = timeit.timeit(lambda: unframe(encoded), number=deliveries)
+    return len(encoded), encode / deliveries * 1e6, decode / deliveries * 1e6
+
+
+def main():
+    deliveries = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    message = sample_message()
+    sender_name = 'Mohammad Rezaei'
+    check_payloads(message, sender_name)
+
+    formats = [
+        ('json', json_frame, json_unframe, False),
+        ('json+trimmed', json_frame, json_unframe, True),
+        ('compact', msgpack_frame, msgpack.unpackb, True),
+    ]
+
+    print(f'{"event":<20}{"format":<15}{"bytes":>8}{"encode us":>12}{"decode us":>12}')
+    for event, build in sample_events(message, sender_name):
+        baseline = None
+        for name, frame, unframe, compact in formats:
+            size, encode_us, decode_us = measure(event, build, frame, unframe, compact, deliveries)
+            baseline = baseline or size
+            print(f'{event:<20}{name:<15}{size:>8}{encode_us:>12.2f}{decode_us:>12.2f}'
+                  f'  ({(size - baseline) / baseline:+.0%} bytes)')
+
+
+if __name__ == '__main__':
+    main()
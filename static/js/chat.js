@@ -1,17 +1,46 @@
 class ChatApp {
     constructor() {
-        this.socket = io();
+        // Compact protocol: MessagePack frames, epoch-ms timestamps, no sender_name
+        this.compact = document.body.dataset.wireFormat === 'compact';
+        this.socket = this.compact ? io({ parser: msgpackParser }) : io();
         this.currentChat = null;
         this.currentGroup = null;
         this.typingTimer = null;
+        this.memberNames = {};
         this.init();
     }
 
     init() {
+        this.loadMemberNames();
         this.bindEvents();
         this.setupSocketListeners();
     }
 
+    loadMemberNames() {
+        // Contacts in the sidebar
+        document.querySelectorAll('#contactList .contact-item[data-user-id]').forEach(item => {
+            const nameElement = item.querySelector('.contact-name');
+            if (nameElement) {
+                this.memberNames[item.dataset.userId] = nameElement.textContent.trim();
+            }
+        });
+    }
+
+    loadGroupMemberNames(groupId) {
+        // Group members rendered by the server on the sidebar entry
+        const groupItem = document.querySelector(`#groupList .contact-item[data-group-id="${groupId}"]`);
+        if (groupItem && groupItem.dataset.memberNames) {
+            Object.assign(this.memberNames, JSON.parse(groupItem.dataset.memberNames));
+        }
+    }
+
+    resolveSender(data) {
+        if (!data.sender_name) {
+            data.sender_name = this.memberNames[data.sender_id] || '';
+        }
+        return data;
+    }
+
     bindEvents() {
         // Message input events
         const messageInput = document.getElementById('messageInput');
@@ -43,7 +72,7 @@ class ChatApp {
     setupSocketListeners() {
         // Private messages
         this.socket.on('new_message', (data) => {
-            this.displayMessage(data, 'received');
+            this.displayMessage(this.resolveSender(data), 'received');
             this.scrollToBottom();
         });
 
@@ -54,7 +83,7 @@ class ChatApp {
         // Group messages
         this.socket.on('new_group_message', (data) => {
             if (this.currentGroup && data.group_id == this.currentGroup) {
-                this.displayMessage(data, 'received');
+                this.displayMessage(this.resolveSender(data), 'received');
                 this.scrollToBottom();
             }
         });
@@ -86,6 +115,7 @@ class ChatApp {
     setCurrentGroup(groupId) {
         this.currentGroup = groupId;
         this.currentChat = null;
+        this.loadGroupMemberNames(groupId);
         this.clearMessages();
         this.loadGroupHistory();
     }
@@ -179,6 +209,13 @@ class ChatApp {
         const bubbleDiv = document.createElement('div');
         bubbleDiv.className = 'message-bubble';
 
+        if (type === 'received' && data.group_id) {
+            const senderDiv = document.createElement('div');
+            senderDiv.className = 'message-sender';
+            senderDiv.textContent = data.sender_name;
+            bubbleDiv.appendChild(senderDiv);
+        }
+
         const contentDiv = document.createElement('div');
         contentDiv.className = 'message-content';
         
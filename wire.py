@@ -0,0 +1,38 @@
+import calendar
+
+
+def epoch_ms(dt):
+    # Message.timestamp is stored as naive UTC (datetime.utcnow); stay in integers
+    return calendar.timegm(dt.utctimetuple()) * 1000 + dt.microsecond // 1000
+
+
+def wire_timestamp(dt, compact):
+    return epoch_ms(dt) if compact else dt.isoformat()
+
+
+def new_message_payload(message, sender_name, compact=False):
+    payload = {
+        'id': message.id,
+        'sender_id': message.sender_id,
+        'content': message.content,
+        'timestamp': wire_timestamp(message.timestamp, compact),
+        'type': message.message_type
+    }
+    # Compact clients resolve the sender from their cached member map
+    if not compact:
+        payload['sender_name'] = sender_name
+    return payload
+
+
+def new_group_message_payload(message, group_id, sender_name, compact=False):
+    payload = new_message_payload(message, sender_name, compact)
+    # group_id stays: a user's room receives every group, the client filters on it
+    payload['group_id'] = group_id
+    return payload
+
+
+def message_sent_payload(message, compact=False):
+    return {
+        'id': message.id,
+        'timestamp': wire_timestamp(message.timestamp, compact)
+    }